@@ -5,10 +5,11 @@ It is not part of the public API.
 """
 
 from infrakit._internal.mapper import ExceptionMapper, MappingStrategy
-from infrakit._internal.registry import StrategyRegistry
+from infrakit._internal.registry import RegistryExceptionMapper, StrategyRegistry
 
 __all__ = [
     "ExceptionMapper",
     "MappingStrategy",
+    "RegistryExceptionMapper",
     "StrategyRegistry",
 ]
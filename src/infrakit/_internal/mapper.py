@@ -1,6 +1,7 @@
 """Base interfaces for exception mapping."""
 
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from infrakit.repository.exceptions import DatabaseError
 
@@ -11,8 +12,17 @@ class MappingStrategy(ABC):
     Each strategy handles one type of error (e.g., unique violation,
     foreign key violation, etc.) and converts it to the appropriate
     domain exception.
+
+    Attributes:
+        exception_types: Exception classes the strategy can handle, used by
+            StrategyRegistry to index it. An empty tuple means the strategy is
+            tried for every error.
     """
 
+    __slots__ = ()
+
+    exception_types: ClassVar[tuple[type[Exception], ...]] = ()
+
     @abstractmethod
     def can_handle(self, error: Exception) -> bool:
         """Check if this strategy can handle the given error.
@@ -53,6 +63,8 @@ class ExceptionMapper(ABC):
     set of mapping strategies.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def map(
         self,
@@ -1,8 +1,12 @@
 """Reusable strategy registry for exception mapping."""
 
+import functools
 import logging
+from typing import Any, ClassVar
 
-from infrakit._internal.mapper import MappingStrategy
+from typing_extensions import override
+
+from infrakit._internal.mapper import ExceptionMapper, MappingStrategy
 from infrakit.repository.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
@@ -11,20 +15,85 @@ logger = logging.getLogger(__name__)
 class StrategyRegistry:
     """Registry of mapping strategies.
 
-    Strategies are tried in registration order until one successfully
-    maps the error.
+    Strategies registered with exception types are indexed by type and only
+    considered for errors whose class derives from one of those types. They are
+    tried from the most specific exception class to the least specific one,
+    followed by the untyped strategies in registration order.
     """
 
+    __slots__ = ("_by_type", "_registered", "_resolve", "_strategies")
+
     def __init__(self) -> None:
         self._strategies: list[MappingStrategy] = []
+        self._by_type: dict[type[Exception], list[MappingStrategy]] = {}
+        # Indexed by the handle returned by register(), None once unregistered
+        self._registered: list[tuple[MappingStrategy, tuple[type[Exception], ...]] | None] = []
+        # Candidates are resolved once per concrete exception class
+        self._resolve = functools.lru_cache(maxsize=128)(self._candidates)
 
-    def register(self, strategy: MappingStrategy) -> None:
+    def register(
+        self,
+        strategy: MappingStrategy,
+        exc_types: tuple[type[Exception], ...] | None = None,
+    ) -> int:
         """Register a new mapping strategy.
 
         Args:
             strategy: The strategy to register
+            exc_types: Exception types the strategy handles, defaulting to
+                strategy.exception_types. When empty, the strategy is tried for
+                every error as a fallback.
+
+        Returns:
+            A handle that can be passed to unregister()
         """
-        self._strategies.append(strategy)
+        if exc_types is None:
+            exc_types = strategy.exception_types
+        if not exc_types:
+            self._strategies.append(strategy)
+        for exc_type in exc_types:
+            self._by_type.setdefault(exc_type, []).append(strategy)
+        self._registered.append((strategy, exc_types))
+        self._resolve.cache_clear()
+        return len(self._registered) - 1
+
+    def unregister(self, handle: int) -> None:
+        """Remove a previously registered strategy.
+
+        Args:
+            handle: The handle returned by register()
+
+        Raises:
+            KeyError: If the handle is unknown or was already unregistered
+        """
+        registered = self._registered[handle] if 0 <= handle < len(self._registered) else None
+        if registered is None:
+            raise KeyError(handle)
+        self._registered[handle] = None
+        strategy, exc_types = registered
+        if not exc_types:
+            self._strategies.remove(strategy)
+        for exc_type in exc_types:
+            self._by_type[exc_type].remove(strategy)
+        self._resolve.cache_clear()
+
+    def _candidates(self, error_type: type[Exception]) -> tuple[MappingStrategy, ...]:
+        """Collect the strategies that may handle an error of the given type.
+
+        Args:
+            error_type: The class of the error to map
+
+        Returns:
+            The typed strategies found along the MRO of error_type, followed by
+            the untyped fallback strategies.
+        """
+        candidates: list[MappingStrategy] = []
+        for cls in error_type.__mro__:
+            strategies = self._by_type.get(cls)
+            if strategies is not None:
+                candidates.extend(s for s in strategies if s not in candidates)
+        candidates.extend(self._strategies)
+        return tuple(candidates)
 
     def map(
         self,
@@ -43,20 +112,69 @@ class StrategyRegistry:
             The mapped domain exception (always returns a DatabaseError).
             If no strategy can handle the error, returns a generic DatabaseError.
         """
-        for strategy in self._strategies:
+        for strategy in self._resolve(type(error)):
             if strategy.can_handle(error):
                 try:
-                    return strategy.map(error, entity_type, entity_id)
-                except Exception:  # noqa: BLE001
+                    mapped = strategy.map(error, entity_type, entity_id)
+                except Exception:
                     # Intentionally catching all exceptions to try next strategy
-                    logger.debug(
-                        "Strategy %s failed to map, try the next strategy.",
-                        strategy.__name__,
-                        exc_info=True,
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Strategy %s failed to map, try the next strategy.",
+                            type(strategy).__name__,
+                            exc_info=True,
+                        )
                     continue
+                return mapped
 
         # No strategy was able to map, raise DatabaseError
         return DatabaseError(
             f"Database error during operation on {entity_type or 'unknown entity'}: {error}"
         )
+
+
+class RegistryExceptionMapper(ExceptionMapper):
+    """Exception mapper delegating to a StrategyRegistry shared by the class.
+
+    The registry is built once per subclass, when the class is defined, by
+    _build_registry(). This base class uses an empty registry, so it maps every
+    error to a generic DatabaseError. Instances hold no state.
+    """
+
+    __slots__ = ()
+
+    _shared_registry: ClassVar[StrategyRegistry] = StrategyRegistry()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._shared_registry = cls._build_registry()
+
+    @classmethod
+    def _build_registry(cls) -> StrategyRegistry:
+        """Build the strategy registry shared by all instances of the mapper.
+
+        Subclasses override this to register their strategies.
+
+        Returns:
+            The registry used by this mapper class (empty by default)
+        """
+        return StrategyRegistry()
+
+    @override
+    def map(
+        self,
+        error: Exception,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+    ) -> DatabaseError:
+        """Map an infrastructure exception using the shared registry.
+
+        Args:
+            error: The infrastructure exception
+            entity_type: Optional entity type name for better error messages
+            entity_id: Optional entity ID for better error messages
+
+        Returns:
+            The mapped domain exception, or a generic DatabaseError
+        """
+        return self._shared_registry.map(error, entity_type, entity_id)
@@ -2,12 +2,20 @@
 
 
 class DatabaseError(Exception):
-    """Base exception for all database-related errors."""
+    """Base exception for all database-related errors.
+
+    Subclasses declare their attributes in __slots__ so raising them does not
+    allocate an instance __dict__.
+    """
+
+    __slots__ = ()
 
 
 class EntityNotFoundError(DatabaseError):
     """Raised when an entity cannot be found by its identifier."""
 
+    __slots__ = ("entity_id", "entity_type")
+
     def __init__(self, entity_type: str, entity_id: str) -> None:
         self.entity_type = entity_type
         self.entity_id = entity_id
@@ -17,6 +25,8 @@ class EntityNotFoundError(DatabaseError):
 class EntityAlreadyExistsError(DatabaseError):
     """Raised when attempting to create an entity that already exists."""
 
+    __slots__ = ("entity_id", "entity_type")
+
     def __init__(self, entity_type: str, entity_id: str) -> None:
         self.entity_type = entity_type
         self.entity_id = entity_id
@@ -26,10 +36,14 @@ class EntityAlreadyExistsError(DatabaseError):
 class EntityModelError(DatabaseError):
     """Raised when the model of an entity does not match with the one instantiated."""
 
+    __slots__ = ()
+
 
 class PaginationParameterError(DatabaseError):
     """Raised when a pagination parameter (limit or offset) is invalid."""
 
+    __slots__ = ("parameter_name", "value")
+
     def __init__(self, parameter_name: str, value: int) -> None:
         self.parameter_name = parameter_name
         self.value = value
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from itertools import islice
+from typing import TYPE_CHECKING
+
 from typing_extensions import override
 
 from infrakit.repository.exceptions import (
@@ -13,6 +17,9 @@ from infrakit.repository.exceptions import (
 from infrakit.repository.memory.session import InMemorySession
 from infrakit.repository.protocols import ID, Repository, T
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 
 class InMemory(Repository[T, ID]):
     """In-memory implementation of the Repository pattern.
@@ -53,6 +60,12 @@ class InMemory(Repository[T, ID]):
     Note:
         When auto_commit=False, transaction management should be handled externally
         (e.g., via a Unit of Work pattern).
+
+        Entities are stored as is, never copied: the instances returned by the
+        repository are the ones held by the session. An entity mutated in place
+        changes the committed storage immediately and is not undone by a rollback.
+        To change an entity within a transaction, build a new instance (e.g. with
+        pydantic's model_copy(update=...)) and pass it to update().
     """
 
     def __init__(
@@ -80,9 +93,30 @@ class InMemory(Repository[T, ID]):
                 msg = "session is required when auto_commit=False"
                 raise ValueError(msg)
             session = InMemorySession()
-        self.session = session
         self.entity_model = entity_model
+        # Storage dicts of the session, valid while its generation is unchanged
+        self._storage_cache: dict[str, T] = {}
+        self._readable_storage_cache: dict[str, T] = {}
+        self.session = session
+        self._maybe_commit: Callable[[], Awaitable[None]]
         self.auto_commit = auto_commit
+        self._entity_type_name = entity_model.__name__
+
+    @property
+    def session(self) -> InMemorySession:
+        """The InMemorySession used for storage and transaction management."""
+        return self._session
+
+    @session.setter
+    def session(self, value: InMemorySession) -> None:
+        """Set the session and invalidate the storage dicts cached from the previous one.
+
+        Generations are only comparable within a session, so the caches are
+        reset even if both sessions are at the same generation.
+        """
+        self._session = value
+        self._storage_generation = -1
+        self._readable_storage_generation = -1
 
     @property
     def entities(self) -> dict[str, T]:
@@ -106,17 +140,51 @@ class InMemory(Repository[T, ID]):
             The active storage dictionary - staging if in transaction,
             otherwise committed storage.
         """
-        return self.session.get_active_storage(self.entity_model)
+        if self.session.generation != self._storage_generation:
+            self._storage_cache = self.session.get_active_storage(self.entity_model)
+            # Read after the call, which bumps the generation when it stages a copy
+            self._storage_generation = self.session.generation
+        return self._storage_cache
+
+    def _get_readable_storage(self) -> dict[str, T]:
+        """Get the storage dictionary to read entities of this type from.
+
+        Returns:
+            The staging dictionary if this entity type was written during the
+            current transaction, otherwise committed storage. It must not be modified.
+        """
+        generation = self.session.generation
+        if generation != self._readable_storage_generation:
+            self._readable_storage_cache = self.session.get_readable_storage(self.entity_model)
+            self._readable_storage_generation = generation
+        return self._readable_storage_cache
+
+    @property
+    def auto_commit(self) -> bool:
+        """Whether to automatically commit after each operation."""
+        return self._auto_commit
 
-    async def _commit_if_enabled(self) -> None:
-        """Commit the session if auto_commit is enabled.
+    @auto_commit.setter
+    def auto_commit(self, value: bool) -> None:
+        """Set auto_commit and bind the matching commit behavior.
+
+        The choice between committing and doing nothing is made here once,
+        so write operations do not re-check the flag on every call.
+        """
+        self._auto_commit = value
+        self._maybe_commit = self._commit if value else self._skip_commit
+
+    async def _commit(self) -> None:
+        """Commit the session (bound as _maybe_commit when auto_commit=True)."""
+        await self.session.commit()
+
+    async def _skip_commit(self) -> None:
+        """Do nothing (bound as _maybe_commit when auto_commit=False).
 
         Note:
-            When auto_commit=False, this method does nothing. Changes will be
-            committed when the session is committed externally (e.g., by a Unit of Work).
+            Changes will be committed when the session is committed externally
+            (e.g., by a Unit of Work).
         """
-        if self.auto_commit:
-            await self.session.commit()
 
     def _ensure_entity_model(self, entity: T) -> None:
         """Ensure an entity is of the correct model type.
@@ -127,38 +195,49 @@ class InMemory(Repository[T, ID]):
         Raises:
             EntityModelError: If the entity is not of the expected model type.
         """
-        if not isinstance(entity, self.entity_model):
-            actual_type = entity.__class__.__name__
-            msg = f"Entity must be of type {self.entity_model.__name__}, got {actual_type}"
-            raise EntityModelError(msg)
+        # Exact type match is a pointer comparison and skips the MRO walk
+        if type(entity) is self.entity_model or isinstance(entity, self.entity_model):
+            return
+        actual_type = type(entity).__name__
+        msg = f"Entity must be of type {self._entity_type_name}, got {actual_type}"
+        raise EntityModelError(msg)
+
+    def _key(self, entity_id: ID) -> str:
+        """Normalize an entity identifier to its storage key.
+
+        Args:
+            entity_id: The unique identifier of the entity.
+
+        Returns:
+            The identifier as a string, without calling str() when it already is one.
+        """
+        return entity_id if type(entity_id) is str else str(entity_id)
 
-    def _ensure_entity_exists(self, entity_id: ID) -> None:
-        """Ensure an entity with the given ID exists in the repository.
+    def _ensure_entity_exists(self, storage: dict[str, T], key: str) -> None:
+        """Ensure an entity with the given key exists in the repository.
 
         Args:
-            entity_id: The unique identifier to check.
+            storage: The active storage, as returned by _get_storage().
+            key: The storage key of the entity, as returned by _key().
 
         Raises:
             EntityNotFoundError: If no entity exists with the given identifier.
         """
-        if str(entity_id) not in self._get_storage():
-            raise EntityNotFoundError(
-                entity_type=self.entity_model.__name__, entity_id=str(entity_id)
-            )
+        if key not in storage:
+            raise EntityNotFoundError(entity_type=self._entity_type_name, entity_id=key)
 
-    def _ensure_entity_not_exists(self, entity_id: ID) -> None:
-        """Ensure an entity with the given ID does not exist in the repository.
+    def _ensure_entity_not_exists(self, storage: dict[str, T], key: str) -> None:
+        """Ensure an entity with the given key does not exist in the repository.
 
         Args:
-            entity_id: The unique identifier to check.
+            storage: The active storage, as returned by _get_storage().
+            key: The storage key of the entity, as returned by _key().
 
         Raises:
             EntityAlreadyExistsError: If an entity with the given identifier already exists.
         """
-        if str(entity_id) in self._get_storage():
-            raise EntityAlreadyExistsError(
-                entity_type=self.entity_model.__name__, entity_id=str(entity_id)
-            )
+        if key in storage:
+            raise EntityAlreadyExistsError(entity_type=self._entity_type_name, entity_id=key)
 
     @override
     async def get_by_id(self, entity_id: ID) -> T:
@@ -173,8 +252,12 @@ class InMemory(Repository[T, ID]):
         Raises:
             EntityNotFoundError: If no entity exists with the given identifier.
         """
-        self._ensure_entity_exists(entity_id)
-        return self._get_storage()[str(entity_id)]
+        key = self._key(entity_id)
+        # EAFP: a single hash lookup instead of a membership test plus a read
+        try:
+            return self._get_readable_storage()[key]
+        except KeyError:
+            raise EntityNotFoundError(entity_type=self._entity_type_name, entity_id=key) from None
 
     @override
     async def get_all(self, limit: int | None = None, offset: int = 0) -> list[T]:
@@ -194,20 +277,19 @@ class InMemory(Repository[T, ID]):
         Raises:
             PaginationParameterError: If limit or offset is negative.
         """
-        if limit is not None and limit < 0:
-            msg = "limit"
-            raise PaginationParameterError(msg, limit)
-        if offset < 0:
+        if offset < 0 or (limit is not None and limit < 0):
+            if limit is not None and limit < 0:
+                msg = "limit"
+                raise PaginationParameterError(msg, limit)
             msg = "offset"
             raise PaginationParameterError(msg, offset)
-        result: list[T] = list(self._get_storage().values())
+        values = self._get_readable_storage().values()
         if limit is None:
             if offset > 0:
-                return result[offset:]
-            return result
-        if offset > 0:
-            return result[offset : offset + limit]
-        return result[:limit]
+                return list(islice(values, offset, None))
+            return list(values)
+        # Only walk the requested window instead of materializing every entity
+        return list(islice(values, offset, offset + limit))
 
     @override
     async def insert_one(self, entity: T) -> T:
@@ -224,9 +306,14 @@ class InMemory(Repository[T, ID]):
                 (only when auto_commit=True or when committed by a Unit of Work).
         """
         self._ensure_entity_model(entity)
-        self._ensure_entity_not_exists(entity_id=entity.id)
-        self._get_storage()[str(entity.id)] = entity
-        await self._commit_if_enabled()
+        key = self._key(entity.id)
+        storage = self._get_storage()
+        # setdefault checks and inserts with a single hash lookup
+        size = len(storage)
+        storage.setdefault(key, entity)
+        if len(storage) == size:
+            raise EntityAlreadyExistsError(entity_type=self._entity_type_name, entity_id=key)
+        await self._maybe_commit()
         return entity
 
     @override
@@ -251,19 +338,33 @@ class InMemory(Repository[T, ID]):
         if not entities:
             return []
 
-        inserts: dict[str, T] = {}
+        # Bind the helpers once and read each entity.id a single time
+        entity_model = self.entity_model
+        to_key = self._key
+        keys: list[str] = []
+        append_key = keys.append
         for entity in entities:
-            self._ensure_entity_model(entity)
-            self._ensure_entity_not_exists(entity_id=entity.id)
-            # Check for duplicates within the input list
-            if str(entity.id) in inserts:
-                raise EntityAlreadyExistsError(
-                    entity_type=self.entity_model.__name__,
-                    entity_id=str(entity.id),
-                )
-            inserts[str(entity.id)] = entity
-        self._get_storage().update(inserts)
-        await self._commit_if_enabled()
+            # Inline the exact type match, only subclasses pay for the method call
+            if type(entity) is not entity_model:
+                self._ensure_entity_model(entity)
+            append_key(to_key(entity.id))
+        key_set = set(keys)
+        # Check for duplicates within the input list
+        if len(key_set) != len(keys):
+            duplicate = next(key for key, count in Counter(keys).items() if count > 1)
+            raise EntityAlreadyExistsError(
+                entity_type=self._entity_type_name,
+                entity_id=duplicate,
+            )
+        storage = self._get_storage()
+        # Check all keys against the storage in a single C-level call
+        if not key_set.isdisjoint(storage):
+            raise EntityAlreadyExistsError(
+                entity_type=self._entity_type_name,
+                entity_id=next(key for key in keys if key in storage),
+            )
+        storage.update(zip(keys, entities, strict=True))
+        await self._maybe_commit()
         return entities
 
     @override
@@ -276,9 +377,12 @@ class InMemory(Repository[T, ID]):
         Raises:
             EntityNotFoundError: If no entity exists with the given identifier.
         """
-        self._ensure_entity_exists(entity_id)
-        del self._get_storage()[str(entity_id)]
-        await self._commit_if_enabled()
+        key = self._key(entity_id)
+        try:
+            del self._get_storage()[key]
+        except KeyError:
+            raise EntityNotFoundError(entity_type=self._entity_type_name, entity_id=key) from None
+        await self._maybe_commit()
 
     @override
     async def delete_all(self) -> None:
@@ -287,7 +391,7 @@ class InMemory(Repository[T, ID]):
         This operation clears the entire repository.
         """
         self._get_storage().clear()
-        await self._commit_if_enabled()
+        await self._maybe_commit()
 
     @override
     async def update(self, entity: T) -> T:
@@ -303,7 +407,9 @@ class InMemory(Repository[T, ID]):
             EntityNotFoundError: If no entity exists with the given identifier.
         """
         self._ensure_entity_model(entity)
-        self._ensure_entity_exists(entity.id)
-        self._get_storage()[str(entity.id)] = entity
-        await self._commit_if_enabled()
+        key = self._key(entity.id)
+        storage = self._get_storage()
+        self._ensure_entity_exists(storage, key)
+        storage[key] = entity
+        await self._maybe_commit()
         return entity
@@ -1,6 +1,5 @@
 """In-memory session with transaction support."""
 
-import copy
 from types import TracebackType
 from typing import Any, Self
 
@@ -27,10 +26,18 @@ class InMemorySession:
        - Isolation: changes are not visible until committed
        - Rollback discards all staged changes
 
+    Staging is copy-on-write: the storage of an entity type is copied (shallowly)
+    the first time it is requested for writing during a transaction, and only
+    staged types are written back on commit. Read-only transactions copy nothing.
+    Entities themselves are shared between storage and staging, so they must be
+    treated as immutable: replace them (e.g. with pydantic's
+    model_copy(update=...)) instead of mutating them in place.
+
     Attributes:
-        _staging: Temporary buffer for uncommitted changes during a transaction.
+        _staging: Per-type copies of the storage accessed during a transaction.
         _storage: Permanent storage for committed data.
         _in_transaction: Flag indicating if a transaction is currently active.
+        _generation: Counter incremented whenever the active storage dicts may change.
 
     Example - Auto-commit mode:
         >>> session = InMemorySession()
@@ -59,12 +66,14 @@ class InMemorySession:
         self._staging: dict[type[Any], dict[str, Any]] = {}
         self._storage: dict[type[Any], dict[str, Any]] = {}
         self._in_transaction = False
+        self._generation = 0
 
     async def begin(self) -> None:
-        """Start a new transaction by creating a snapshot of the current storage.
+        """Start a new transaction.
 
-        This creates a deep copy of the storage, allowing modifications to be made
-        in isolation.
+        No data is copied here: the storage of each entity type is copied into the
+        staging area on first access through get_active_storage().
+        get_readable_storage() never copies.
 
         After calling begin(), all repository operations will work on the staging
         area until commit() or rollback() is called.
@@ -83,8 +92,7 @@ class InMemorySession:
             )
             raise DatabaseError(msg)
         self._in_transaction = True
-        # Create a deep copy to ensure complete isolation
-        self._staging = copy.deepcopy(self._storage)
+        self._generation += 1
 
     async def commit(self) -> None:
         """Commit the current transaction, applying all staged changes to storage.
@@ -97,10 +105,11 @@ class InMemorySession:
         if not self._in_transaction:
             return
 
-        # Apply all staged changes atomically with deep copy to avoid reference issues
-        self._storage = copy.deepcopy(self._staging)
+        # Only the entity types accessed during the transaction were staged
+        self._storage.update(self._staging)
         self._staging = {}
         self._in_transaction = False
+        self._generation += 1
 
     async def rollback(self) -> None:
         """Roll back the current transaction, discarding all staged changes.
@@ -120,6 +129,7 @@ class InMemorySession:
 
         self._staging = {}
         self._in_transaction = False
+        self._generation += 1
 
     async def close(self) -> None:
         """Close the session.
@@ -168,10 +178,52 @@ class InMemorySession:
             otherwise committed storage. Creates a new empty dict if none exists.
         """
         if self._in_transaction:
-            return self._staging.setdefault(entity_type, {})
+            staging = self._staging.get(entity_type)
+            if staging is None:
+                # Copy-on-write: copy the committed entities of this type on first access
+                staging = self._staging[entity_type] = dict(self._storage.get(entity_type, {}))
+                # Readers holding the committed dict must switch to the staged one
+                self._generation += 1
+            return staging
         # If no transaction is active, return committed storage (auto-commit mode)
         return self.get_committed_storage(entity_type)
 
+    def get_readable_storage(self, entity_type: type[T]) -> dict[str, T]:
+        """Get the storage dictionary to read entities of a specific type from.
+
+        This method is intended for use by InMemory repositories.
+        End users should interact with repositories and unit of work, not sessions directly.
+
+        Unlike get_active_storage(), this never stages a copy: during a transaction,
+        entity types that have not been written yet are read from committed storage.
+        The returned dictionary must not be modified.
+
+        Args:
+            entity_type: The entity class to get storage for.
+
+        Returns:
+            The staged storage dictionary if this entity type was written during
+            the transaction, otherwise committed storage.
+        """
+        if self._in_transaction:
+            staging = self._staging.get(entity_type)
+            if staging is not None:
+                return staging
+        return self.get_committed_storage(entity_type)
+
+    @property
+    def generation(self) -> int:
+        """Counter identifying the current set of active storage dicts.
+
+        It changes on begin(), commit(), rollback() and whenever an entity type is
+        staged, so a dict returned by get_active_storage() or get_readable_storage()
+        can be reused for as long as the generation is unchanged.
+
+        Returns:
+            The current generation number.
+        """
+        return self._generation
+
     @property
     def in_transaction(self) -> bool:
         """Check if a transaction is currently active.
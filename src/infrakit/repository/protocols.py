@@ -31,6 +31,8 @@ class Repository(ABC, Generic[T, ID]):
         ID: The type of the entity's identifier (int, str, UUID, etc.).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_by_id(self, entity_id: ID) -> T:
         """Retrieve an entity by its unique identifier.
@@ -129,6 +131,8 @@ class UnitOfWork(ABC):
     It ensures that all operations within the unit are executed atomically, either all succeed or all fail.
     """
 
+    __slots__ = ()
+
     # TODO: fix typing
     repositories: Mapping[type, Repository]  # pyright: ignore[reportMissingTypeArgument]
 
@@ -1,6 +1,6 @@
 """Strategy for handling database pagination parameter errors."""
 
-from typing import cast
+import re
 
 from sqlalchemy.exc import DBAPIError
 from typing_extensions import override
@@ -8,6 +8,9 @@ from typing_extensions import override
 from infrakit._internal.mapper import MappingStrategy
 from infrakit.repository.exceptions import DatabaseError, PaginationParameterError
 
+# Single scan for both messages, capturing which parameter is invalid
+_PAGINATION_ERROR_RE = re.compile(r"(LIMIT|OFFSET) must not be negative")
+
 
 class SqlAlchemyPaginationErrorStrategy(MappingStrategy):
     """Handle database pagination errors (negative limit/offset).
@@ -16,24 +19,14 @@ class SqlAlchemyPaginationErrorStrategy(MappingStrategy):
     InvalidRowCountInResultOffsetClauseError to PaginationParameterError.
     """
 
+    __slots__ = ()
+
+    exception_types = (DBAPIError,)
+
     @override
     def can_handle(self, error: Exception) -> bool:
         """Check if error is a DBAPIError wrapping a pagination error."""
-        if not isinstance(error, DBAPIError):
-            return False
-
-        # Check the original exception from the driver (asyncpg)
-        orig = getattr(error, "orig", None)
-        if orig is None:
-            return False
-
-        # Check if error message contains pagination keywords
-        # The orig is wrapped by SQLAlchemy, so we check the string representation
-        error_message = str(orig)
-        return (
-            "LIMIT must not be negative" in error_message
-            or "OFFSET must not be negative" in error_message
-        )
+        return self._match(error) is not None
 
     @override
     def map(
@@ -49,18 +42,10 @@ class SqlAlchemyPaginationErrorStrategy(MappingStrategy):
             entity_type: Not used for pagination errors
             entity_id: Not used for pagination errors
         """
-        # Safe cast: can_handle() already verified it's a DBAPIError
-        dbapi_error = cast("DBAPIError", error)
-
         # Determine parameter name from the error message
-        error_message = str(dbapi_error.orig)
-        if "LIMIT must not be negative" in error_message:
-            parameter_name = "limit"
-        elif "OFFSET must not be negative" in error_message:
-            parameter_name = "offset"
-        else:
-            # Fallback - shouldn't happen if can_handle works correctly
-            parameter_name = "unknown"
+        match = self._match(error)
+        # Fallback to "unknown" shouldn't happen if can_handle works correctly
+        parameter_name = match.group(1).lower() if match is not None else "unknown"
 
         # Extract value from the error message or use -1 as placeholder
         # asyncpg doesn't provide the value directly in the exception
@@ -69,3 +54,25 @@ class SqlAlchemyPaginationErrorStrategy(MappingStrategy):
         # but we don't have easy access to it from here
 
         return PaginationParameterError(parameter_name, value)
+
+    @staticmethod
+    def _match(error: Exception) -> re.Match[str] | None:
+        """Search the driver error message for a negative LIMIT or OFFSET.
+
+        Args:
+            error: The exception to inspect
+
+        Returns:
+            The match, whose first group is LIMIT or OFFSET, or None if error is
+            not a DBAPIError wrapping a pagination error.
+        """
+        if not isinstance(error, DBAPIError):
+            return None
+
+        # Check the original exception from the driver (asyncpg)
+        orig = getattr(error, "orig", None)
+        if orig is None:
+            return None
+
+        # The orig is wrapped by SQLAlchemy, so we check the string representation
+        return _PAGINATION_ERROR_RE.search(str(orig))
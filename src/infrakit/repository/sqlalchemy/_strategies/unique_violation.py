@@ -1,7 +1,6 @@
 """Strategy for handling SQLAlchemy unique constraint violations."""
 
 import re
-from typing import cast
 
 from sqlalchemy.exc import IntegrityError
 from typing_extensions import override
@@ -9,6 +8,9 @@ from typing_extensions import override
 from infrakit._internal.mapper import MappingStrategy
 from infrakit.repository.exceptions import DatabaseError, EntityAlreadyExistsError
 
+# The suffix check is part of the pattern, see _is_primary_key_violation()
+_PRIMARY_KEY_VIOLATION_RE = re.compile(r'violates unique constraint "[^"]*_pkey"')
+
 
 class SqlAlchemyUniqueViolationStrategy(MappingStrategy):
     """Handle PostgreSQL unique constraint violations (sqlstate 23505).
@@ -17,10 +19,15 @@ class SqlAlchemyUniqueViolationStrategy(MappingStrategy):
     Other unique constraints are not mapped (raised as-is).
     """
 
+    __slots__ = ()
+
+    exception_types = (IntegrityError,)
+
     @override
     def can_handle(self, error: Exception) -> bool:
         """Check if error is a SQLAlchemy IntegrityError with sqlstate 23505."""
-        if not isinstance(error, IntegrityError):
+        # Exact type match first, SQLAlchemy raises IntegrityError itself
+        if type(error) is not IntegrityError and not isinstance(error, IntegrityError):
             return False
 
         sqlstate = getattr(error.orig, "sqlstate", None)
@@ -40,10 +47,7 @@ class SqlAlchemyUniqueViolationStrategy(MappingStrategy):
             entity_type: The entity type name for error messages
             entity_id: The entity ID for error messages
         """
-        # Safe cast: can_handle() already verified it's an IntegrityError
-        integrity_error = cast("IntegrityError", error)
-
-        if self._is_primary_key_violation(integrity_error):
+        if self._is_primary_key_violation(error):
             return EntityAlreadyExistsError(entity_type or "Entity", entity_id or "unknown")
 
         # If it's not a PK, let the original error pass through
@@ -51,19 +55,13 @@ class SqlAlchemyUniqueViolationStrategy(MappingStrategy):
         raise error
 
     @staticmethod
-    def _is_primary_key_violation(error: IntegrityError) -> bool:
+    def _is_primary_key_violation(error: Exception) -> bool:
         """Check if the unique violation is specifically on a primary key.
 
         PostgreSQL names primary key constraints with the suffix '_pkey'.
 
         Args:
-            error: SQLAlchemy IntegrityError (error.orig contains the driver exception)
+            error: SQLAlchemy IntegrityError, as verified by can_handle()
+                (error.orig contains the driver exception)
         """
-        message_str = str(error.orig)
-        match = re.search(r'violates unique constraint "([^"]+)"', message_str)
-
-        if match:
-            constraint_name = match.group(1)
-            return constraint_name.endswith("_pkey")
-
-        return False
+        return _PRIMARY_KEY_VIOLATION_RE.search(str(getattr(error, "orig", None))) is not None
@@ -1,8 +1,12 @@
 """SQLAlchemy commit manager with error handling."""
 
+from typing import Self
+
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrakit._internal.mapper import ExceptionMapper
+from infrakit.repository.sqlalchemy.mapper import DEFAULT_EXCEPTION_MAPPER
 
 
 class SqlAlchemyCommitManager:
@@ -11,10 +15,12 @@ class SqlAlchemyCommitManager:
     This class encapsulates the commit/rollback logic with exception mapping,
     making it reusable across Repository and UnitOfWork implementations.
 
-    The manager always maps infrastructure exceptions to domain exceptions
-    using the provided ExceptionMapper.
+    The manager maps SQLAlchemy exceptions to domain exceptions using the
+    provided ExceptionMapper. Other exceptions propagate unchanged.
     """
 
+    __slots__ = ("_exception_mapper", "_session")
+
     def __init__(self, session: AsyncSession, exception_mapper: ExceptionMapper) -> None:
         """Initialize the commit manager.
 
@@ -25,6 +31,18 @@ class SqlAlchemyCommitManager:
         self._session = session
         self._exception_mapper = exception_mapper
 
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> Self:
+        """Create a commit manager using the shared SQLAlchemy exception mapper.
+
+        Args:
+            session: SQLAlchemy async session
+
+        Returns:
+            A commit manager bound to the session
+        """
+        return cls(session, DEFAULT_EXCEPTION_MAPPER)
+
     async def safe_commit(self, entity_type: str, entity_id: str | None = None) -> None:
         """Execute a commit with error handling and mapping.
 
@@ -33,11 +51,11 @@ class SqlAlchemyCommitManager:
             entity_id: Optional entity ID for error messages
 
         Raises:
-            DatabaseError: Always raises a domain exception (specific or generic)
+            DatabaseError: If SQLAlchemy fails to commit (specific or generic)
         """
         try:
             await self._session.commit()
-        except Exception as e:
+        except SQLAlchemyError as e:
             await self._session.rollback()
 
             # Map infrastructure exception to domain exception
@@ -48,3 +66,7 @@ class SqlAlchemyCommitManager:
                 entity_id=entity_id or "unknown",
             )
             raise domain_error from e
+        except Exception:
+            # Not a database error: restore the session but skip the mapping
+            await self._session.rollback()
+            raise
@@ -2,9 +2,7 @@
 
 from typing_extensions import override
 
-from infrakit._internal.mapper import ExceptionMapper
-from infrakit._internal.registry import StrategyRegistry
-from infrakit.repository.exceptions import DatabaseError
+from infrakit._internal.registry import RegistryExceptionMapper, StrategyRegistry
 from infrakit.repository.sqlalchemy._strategies.pagination_error import (
     SqlAlchemyPaginationErrorStrategy,
 )
@@ -13,43 +11,28 @@ from infrakit.repository.sqlalchemy._strategies.unique_violation import (
 )
 
 
-class SqlAlchemyExceptionMapper(ExceptionMapper):
+class SqlAlchemyExceptionMapper(RegistryExceptionMapper):
     """Maps SQLAlchemy exceptions to domain exceptions.
 
     Uses a registry of strategies to handle different types of errors.
     Each strategy is specific to a type of database constraint violation.
+    The registry is shared by all instances, which hold no state.
     """
 
-    def __init__(self) -> None:
-        self._registry = StrategyRegistry()
-        self._register_strategies()
+    __slots__ = ()
 
-    def _register_strategies(self) -> None:
+    @classmethod
+    @override
+    def _build_registry(cls) -> StrategyRegistry:
         """Register all SQLAlchemy-specific mapping strategies.
 
-        Strategies are tried in registration order.
+        Strategies are indexed by the SQLAlchemy exception types they declare.
         """
-        self._registry.register(SqlAlchemyPaginationErrorStrategy())
-        self._registry.register(SqlAlchemyUniqueViolationStrategy())
+        registry = StrategyRegistry()
+        registry.register(SqlAlchemyPaginationErrorStrategy())
+        registry.register(SqlAlchemyUniqueViolationStrategy())
+        return registry
 
-    @override
-    def map(
-        self,
-        error: Exception,
-        entity_type: str | None = None,
-        entity_id: str | None = None,
-    ) -> DatabaseError:
-        """Map a SQLAlchemy exception to a domain exception.
-
-        Args:
-            error: The SQLAlchemy exception
-            entity_type: The entity type name (e.g., "User")
-            entity_id: The entity ID that caused the error
-
-        Returns:
-            The mapped domain exception
-
-        Raises:
-            The original exception if it cannot be mapped
-        """
-        return self._registry.map(error, entity_type, entity_id)
+
+# Mappers are stateless, so repositories and units of work share this instance
+DEFAULT_EXCEPTION_MAPPER = SqlAlchemyExceptionMapper()
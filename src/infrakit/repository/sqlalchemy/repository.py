@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import delete, select
 from typing_extensions import override
@@ -10,12 +11,33 @@ from typing_extensions import override
 from infrakit.repository.exceptions import EntityNotFoundError
 from infrakit.repository.protocols import ID, Repository, T
 from infrakit.repository.sqlalchemy.commit_manager import SqlAlchemyCommitManager
-from infrakit.repository.sqlalchemy.mapper import SqlAlchemyExceptionMapper
+from infrakit.repository.sqlalchemy.mapper import DEFAULT_EXCEPTION_MAPPER
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy import CursorResult, Delete, Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+@functools.lru_cache(maxsize=128)
+def _base_statements(entity_model: type[Any]) -> tuple[Select[Any], Delete]:
+    """Build the statements that only depend on the entity model.
+
+    They are cached per model, so repositories created for each unit of work
+    reuse them. Core statements are immutable and safe to share. The cache is
+    bounded so models created dynamically (e.g. in tests) are not kept alive
+    indefinitely.
+
+    Args:
+        entity_model: The SQLAlchemy model class.
+
+    Returns:
+        The SELECT of all entities and the DELETE of all entities.
+    """
+    return select(entity_model), delete(entity_model)
+
+
 class SqlAlchemy(Repository[T, ID]):
     """SQLAlchemy implementation of the Repository pattern.
 
@@ -36,6 +58,18 @@ class SqlAlchemy(Repository[T, ID]):
         (e.g., via a Unit of Work pattern).
     """
 
+    __slots__ = (
+        "_auto_commit",
+        "_commit_manager",
+        "_delete_all",
+        "_entity_type_name",
+        "_exception_mapper",
+        "_maybe_commit",
+        "_select_all",
+        "entity_model",
+        "session",
+    )
+
     def __init__(
         self, session: AsyncSession, entity_model: type[T], *, auto_commit: bool = False
     ) -> None:
@@ -48,30 +82,48 @@ class SqlAlchemy(Repository[T, ID]):
         """
         self.session = session
         self.entity_model = entity_model
+        self._maybe_commit: Callable[[object], Awaitable[None]]
         self.auto_commit = auto_commit
-        self._exception_mapper = SqlAlchemyExceptionMapper()
-        self._commit_manager = SqlAlchemyCommitManager(session, self._exception_mapper)
+        self._entity_type_name = entity_model.__name__
+        self._exception_mapper = DEFAULT_EXCEPTION_MAPPER
+        self._commit_manager = SqlAlchemyCommitManager.for_session(session)
+        self._select_all, self._delete_all = _base_statements(entity_model)
+
+    @property
+    def auto_commit(self) -> bool:
+        """Whether to automatically commit after each operation."""
+        return self._auto_commit
+
+    @auto_commit.setter
+    def auto_commit(self, value: bool) -> None:
+        """Set auto_commit and bind the matching commit behavior.
+
+        The choice between committing and doing nothing is made here once,
+        so write operations do not re-check the flag on every call.
+        """
+        self._auto_commit = value
+        self._maybe_commit = self._commit if value else self._skip_commit
 
-    async def _commit_if_enabled(
-        self, entity_type: str | None = None, entity_id: str | None = None
-    ) -> None:
-        """Commit the session if auto_commit is enabled with error handling.
+    async def _commit(self, entity_id: object) -> None:
+        """Commit the session with error handling (bound as _maybe_commit when auto_commit=True).
 
         Args:
-            entity_type: Entity type name for error messages
-            entity_id: Entity ID for error messages
+            entity_id: Entity ID for error messages, converted to a string only here
 
         Raises:
-            DatabaseError: If commit fails (mapped from any infrastructure exception)
+            DatabaseError: If commit fails (mapped from the SQLAlchemy exception)
+        """
+        await self._commit_manager.safe_commit(
+            entity_type=self._entity_type_name, entity_id=str(entity_id)
+        )
+
+    async def _skip_commit(self, entity_id: object) -> None:
+        """Do nothing (bound as _maybe_commit when auto_commit=False).
 
         Note:
-            When auto_commit=False, this method does nothing. Errors will be
-            detected when the session is committed externally (e.g., by a Unit of Work).
+            Errors will be detected when the session is committed externally
+            (e.g., by a Unit of Work).
         """
-        if self.auto_commit:
-            await self._commit_manager.safe_commit(
-                entity_type=entity_type or self.entity_model.__name__, entity_id=entity_id
-            )
 
     @override
     async def get_by_id(self, entity_id: ID) -> T:
@@ -91,13 +143,13 @@ class SqlAlchemy(Repository[T, ID]):
             entity = await self.session.get(self.entity_model, entity_id)
         except Exception as e:
             domain_error = self._exception_mapper.map(
-                error=e, entity_type=self.entity_model.__name__, entity_id=str(entity_id)
+                error=e, entity_type=self._entity_type_name, entity_id=str(entity_id)
             )
             raise domain_error from e
         else:
             if entity is None:
                 raise EntityNotFoundError(
-                    entity_type=self.entity_model.__name__, entity_id=str(entity_id)
+                    entity_type=self._entity_type_name, entity_id=str(entity_id)
                 )
             return entity
 
@@ -118,13 +170,15 @@ class SqlAlchemy(Repository[T, ID]):
             DatabaseError: Otherwise
         """
         try:
-            query = select(self.entity_model).limit(limit).offset(offset)
-            entities = await self.session.execute(query)
-            return list(entities.scalars().all())
+            query = self._select_all.limit(limit).offset(offset)
+            entities = await self.session.scalars(query)
+            # ScalarResult.all() is typed as Sequence but already builds a list,
+            # so cast it instead of copying every row into a new one
+            return cast("list[T]", entities.all())
         except Exception as e:
             # Map database pagination errors to domain exception
             domain_error = self._exception_mapper.map(
-                error=e, entity_type=self.entity_model.__name__, entity_id=None
+                error=e, entity_type=self._entity_type_name, entity_id=None
             )
             raise domain_error from e
 
@@ -143,9 +197,7 @@ class SqlAlchemy(Repository[T, ID]):
                 (only when auto_commit=True or when committed by a Unit of Work).
         """
         self.session.add(entity)
-        await self._commit_if_enabled(
-            entity_type=self.entity_model.__name__, entity_id=str(entity.id)
-        )
+        await self._maybe_commit(entity.id)
         return entity
 
     @override
@@ -166,16 +218,15 @@ class SqlAlchemy(Repository[T, ID]):
             return []
 
         self.session.add_all(entities)
-        await self._commit_if_enabled(
-            entity_type=self.entity_model.__name__, entity_id="multiple entities"
-        )
+        await self._maybe_commit("multiple entities")
         return entities
 
     @override
     async def update(self, entity: T) -> T:
         """Update an existing entity in the repository.
 
-        Verifies that the entity exists before updating.
+        The existence check relies on the SELECT already issued by merge():
+        if no row matches, the merged instance is a new pending object and is discarded.
 
         Args:
             entity: The entity with updated values. Must have a valid identifier.
@@ -185,31 +236,53 @@ class SqlAlchemy(Repository[T, ID]):
 
         Raises:
             EntityNotFoundError: If no entity exists with the given identifier.
+            DatabaseError: Otherwise
         """
-        await self.get_by_id(entity_id=entity.id)
-        await self.session.merge(entity)
-        await self._commit_if_enabled(
-            entity_type=self.entity_model.__name__, entity_id=str(entity.id)
-        )
+        try:
+            merged = await self.session.merge(entity)
+        except Exception as e:
+            domain_error = self._exception_mapper.map(
+                error=e, entity_type=self._entity_type_name, entity_id=str(entity.id)
+            )
+            raise domain_error from e
+        if merged in self.session.new:
+            self.session.expunge(merged)
+            raise EntityNotFoundError(entity_type=self._entity_type_name, entity_id=str(entity.id))
+        await self._maybe_commit(entity.id)
         return entity
 
     @override
     async def delete_by_id(self, entity_id: ID) -> None:
         """Delete an entity from the repository by its identifier.
 
-        Verifies that the entity exists before deleting.
+        Issues a single DELETE statement and checks the affected row count
+        instead of loading the entity first. Unlike Session.delete(), this bulk
+        DELETE bypasses the ORM unit of work:
+        - relationship cascades (cascade="delete", "delete-orphan") are not
+          applied; only ON DELETE rules declared in the database are
+        - before_delete/after_delete mapper events are not emitted
+        - the row is deleted when the statement runs rather than at the next
+          flush. With auto_commit=False it is still committed or rolled back
+          with the surrounding transaction.
 
         Args:
             entity_id: The unique identifier of the entity to delete.
 
         Raises:
             EntityNotFoundError: If no entity exists with the given identifier.
+            DatabaseError: Otherwise
         """
-        existing = await self.get_by_id(entity_id=entity_id)
-        await self.session.delete(existing)
-        await self._commit_if_enabled(
-            entity_type=self.entity_model.__name__, entity_id=str(entity_id)
-        )
+        stmt = delete(self.entity_model).where(self.entity_model.id == entity_id)
+        try:
+            result = cast("CursorResult[Any]", await self.session.execute(stmt))
+        except Exception as e:
+            domain_error = self._exception_mapper.map(
+                error=e, entity_type=self._entity_type_name, entity_id=str(entity_id)
+            )
+            raise domain_error from e
+        if result.rowcount == 0:
+            raise EntityNotFoundError(entity_type=self._entity_type_name, entity_id=str(entity_id))
+        await self._maybe_commit(entity_id)
 
     @override
     async def delete_all(self) -> None:
@@ -218,6 +291,5 @@ class SqlAlchemy(Repository[T, ID]):
         Warning:
             This operation will delete all entities of this type from the database.
         """
-        stmt = delete(self.entity_model)
-        await self.session.execute(stmt)
-        await self._commit_if_enabled(entity_type=self.entity_model.__name__, entity_id="all")
+        await self.session.execute(self._delete_all)
+        await self._maybe_commit("all")
@@ -6,7 +6,6 @@ from typing_extensions import override
 from infrakit.repository.protocols import HasId, UnitOfWork
 from infrakit.repository.sqlalchemy import SqlAlchemy
 from infrakit.repository.sqlalchemy.commit_manager import SqlAlchemyCommitManager
-from infrakit.repository.sqlalchemy.mapper import SqlAlchemyExceptionMapper
 
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
@@ -17,6 +16,8 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
     explicitly to persist changes or rollback() to discard them.
     """
 
+    __slots__ = ("_commit_manager", "entity_models", "repositories", "session", "session_factory")
+
     def __init__(
         self, session_factory: async_sessionmaker[AsyncSession], entity_models: list[type[HasId]]
     ) -> None:
@@ -37,8 +38,7 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
             Self: The unit of a work instance with initialized session and repositories.
         """
         self.session = self.session_factory()
-        self._exception_mapper = SqlAlchemyExceptionMapper()
-        self._commit_manager = SqlAlchemyCommitManager(self.session, self._exception_mapper)
+        self._commit_manager = SqlAlchemyCommitManager.for_session(self.session)
         self.repositories = {
             entity_model: SqlAlchemy(
                 session=self.session, entity_model=entity_model, auto_commit=False
@@ -66,7 +66,7 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         """Commit the current transaction, persisting all changes to the database.
 
         Raises:
-            DatabaseError: If the commit fails (mapped from any infrastructure exception)
+            DatabaseError: If the commit fails (mapped from the SQLAlchemy exception)
         """
         await self._commit_manager.safe_commit(entity_type="Transaction", entity_id=None)
 
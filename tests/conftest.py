@@ -0,0 +1,49 @@
+"""Shared pytest configuration.
+
+Adds two opt-in command line flags for local runs:
+- --cached: run the tests that failed last time first (pytest --ff), using
+  the results stored in .pytest_cache
+- --runslow: also run the tests marked as slow, skipped by default
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --cached and --runslow command line flags."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="run previously failed tests first, based on .pytest_cache (same as --ff)",
+    )
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run the tests marked as slow",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Declare the slow marker and turn --cached into --ff.
+
+    Runs before the cache provider reads its options, so --cached behaves
+    exactly like passing --ff.
+    """
+    config.addinivalue_line(
+        "markers", "slow: test backed by a PostgreSQL container, only run with --runslow"
+    )
+    if config.getoption("cached"):
+        config.option.failedfirst = True
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the tests marked as slow unless --runslow is given."""
+    if config.getoption("runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,232 @@
+"""Tests for StrategyRegistry.
+
+This module tests the dispatch of errors to mapping strategies:
+- Type-indexed strategies are only tried for matching exception classes
+- Untyped strategies act as a fallback for every error
+- Unmapped errors become a generic DatabaseError
+"""
+
+import logging
+
+import pytest
+from typing_extensions import override
+
+# infrakit.repository must be loaded before infrakit._internal (circular import)
+from infrakit.repository.exceptions import DatabaseError, EntityNotFoundError  # isort: skip
+from infrakit._internal.mapper import MappingStrategy
+from infrakit._internal.registry import RegistryExceptionMapper, StrategyRegistry
+
+
+class ParentError(Exception):
+    pass
+
+
+class ChildError(ParentError):
+    pass
+
+
+class RecordingStrategy(MappingStrategy):
+    """Strategy that records each can_handle call and maps to EntityNotFoundError."""
+
+    def __init__(self, label: str, *, handles: bool = True) -> None:
+        self.label = label
+        self.handles = handles
+        self.calls = 0
+
+    @override
+    def can_handle(self, error: Exception) -> bool:
+        self.calls += 1
+        return self.handles
+
+    @override
+    def map(
+        self,
+        error: Exception,
+        entity_type: str | None,
+        entity_id: str | None,
+    ) -> DatabaseError:
+        return EntityNotFoundError(self.label, entity_id or "unknown")
+
+
+class TestStrategyRegistryDispatch:
+    """Tests for type-indexed dispatch."""
+
+    def test_typed_strategy_is_skipped_for_unrelated_error(self) -> None:
+        """A strategy registered for ChildError should never see a ValueError."""
+        registry = StrategyRegistry()
+        strategy = RecordingStrategy("child")
+        registry.register(strategy, (ChildError,))
+
+        result = registry.map(ValueError("boom"), "User", "1")
+
+        assert strategy.calls == 0
+        assert type(result) is DatabaseError
+        assert "Database error during operation on User: boom" in str(result)
+
+    def test_typed_strategy_matches_subclass(self) -> None:
+        """A strategy registered for ParentError should handle a ChildError."""
+        registry = StrategyRegistry()
+        registry.register(RecordingStrategy("parent"), (ParentError,))
+
+        result = registry.map(ChildError("boom"), "User", "1")
+
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "parent"
+
+    def test_most_specific_type_is_tried_first(self) -> None:
+        """The strategy registered for the most derived class wins."""
+        registry = StrategyRegistry()
+        registry.register(RecordingStrategy("parent"), (ParentError,))
+        registry.register(RecordingStrategy("child"), (ChildError,))
+
+        result = registry.map(ChildError("boom"))
+
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "child"
+
+    def test_untyped_strategy_is_used_as_fallback(self) -> None:
+        """Strategies registered without types are tried after typed ones."""
+        registry = StrategyRegistry()
+        typed = RecordingStrategy("typed", handles=False)
+        fallback = RecordingStrategy("fallback")
+        registry.register(typed, (ParentError,))
+        registry.register(fallback)
+
+        result = registry.map(ChildError("boom"))
+
+        assert typed.calls == 1
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "fallback"
+
+    def test_register_invalidates_resolved_candidates(self) -> None:
+        """Strategies registered after a first lookup are still considered."""
+        registry = StrategyRegistry()
+        registry.map(ChildError("warm up"))
+
+        registry.register(RecordingStrategy("late"), (ChildError,))
+        result = registry.map(ChildError("boom"))
+
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "late"
+
+
+class TestStrategyRegistryHandles:
+    """Tests for strategy handles and candidate ordering."""
+
+    def test_unregister_removes_strategy(self) -> None:
+        """An unregistered strategy is no longer tried."""
+        registry = StrategyRegistry()
+        strategy = RecordingStrategy("child")
+        handle = registry.register(strategy, (ChildError,))
+        registry.map(ChildError("warm up"))
+
+        registry.unregister(handle)
+        result = registry.map(ChildError("boom"))
+
+        assert strategy.calls == 1
+        assert type(result) is DatabaseError
+
+    def test_unregister_unknown_handle_raises(self) -> None:
+        """Unregistering twice raises KeyError."""
+        registry = StrategyRegistry()
+        handle = registry.register(RecordingStrategy("fallback"))
+        registry.unregister(handle)
+
+        with pytest.raises(KeyError):
+            registry.unregister(handle)
+
+    def test_registration_order_is_kept_across_calls(self) -> None:
+        """Overlapping strategies are always tried in registration order."""
+        registry = StrategyRegistry()
+        miss = RecordingStrategy("miss", handles=False)
+        first = RecordingStrategy("first")
+        second = RecordingStrategy("second")
+        registry.register(miss)
+        registry.register(first)
+        registry.register(second)
+
+        results = [registry.map(ChildError("boom")) for _ in range(2)]
+
+        assert miss.calls == 2
+        assert second.calls == 0
+        assert all(isinstance(r, EntityNotFoundError) and r.entity_type == "first" for r in results)
+
+
+class DeclaredChildStrategy(RecordingStrategy):
+    """Strategy declaring the exception types it handles."""
+
+    exception_types = (ChildError,)
+
+
+class TestStrategyRegistryDeclaredTypes:
+    """Tests for strategies declaring MappingStrategy.exception_types."""
+
+    def test_declared_types_are_used_by_default(self) -> None:
+        """register() without types indexes the strategy by its exception_types."""
+        registry = StrategyRegistry()
+        strategy = DeclaredChildStrategy("declared")
+        registry.register(strategy)
+
+        registry.map(ParentError("boom"))
+        result = registry.map(ChildError("boom"))
+
+        assert strategy.calls == 1
+        assert isinstance(result, EntityNotFoundError)
+
+
+class FailingStrategy(RecordingStrategy):
+    """Strategy whose map() raises, forcing the registry to try the next one."""
+
+    @override
+    def map(
+        self,
+        error: Exception,
+        entity_type: str | None,
+        entity_id: str | None,
+    ) -> DatabaseError:
+        raise error
+
+
+class TestStrategyRegistryFailingStrategy:
+    """Tests for strategies that fail to map."""
+
+    def test_failing_strategy_falls_through_to_next(self, caplog: pytest.LogCaptureFixture) -> None:
+        """A strategy raising in map() is logged and the next one is tried."""
+        registry = StrategyRegistry()
+        registry.register(FailingStrategy("failing"))
+        registry.register(RecordingStrategy("next"))
+
+        with caplog.at_level(logging.DEBUG, logger="infrakit._internal.registry"):
+            result = registry.map(ChildError("boom"))
+
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "next"
+        assert "Strategy FailingStrategy failed to map" in caplog.text
+
+
+class ChildErrorMapper(RegistryExceptionMapper):
+    """Mapper registering a single strategy for ChildError."""
+
+    @classmethod
+    @override
+    def _build_registry(cls) -> StrategyRegistry:
+        registry = StrategyRegistry()
+        registry.register(DeclaredChildStrategy("declared"))
+        return registry
+
+
+class TestRegistryExceptionMapper:
+    """Tests for mappers sharing a registry built at class definition."""
+
+    def test_map_delegates_to_registry(self) -> None:
+        """map() dispatches through the registry built by _build_registry()."""
+        result = ChildErrorMapper().map(ChildError("boom"), "User", "1")
+
+        assert isinstance(result, EntityNotFoundError)
+        assert result.entity_type == "declared"
+
+    def test_base_mapper_maps_to_generic_error(self) -> None:
+        """The base class has an empty registry and falls back to DatabaseError."""
+        result = RegistryExceptionMapper().map(ChildError("boom"), "User", "1")
+
+        assert type(result) is DatabaseError
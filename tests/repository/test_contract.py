@@ -63,6 +63,11 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         - name: The name/label for the entity
         """
 
+    @pytest.fixture
+    @abstractmethod
+    def entity_model(self) -> type[EntityType]:
+        """Return the entity class managed by the repository under test."""
+
     @pytest.fixture
     @abstractmethod
     async def repository_with_entities(
@@ -148,49 +153,39 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
     @pytest.mark.asyncio
     async def test_get_by_id_not_found(self, repository: Repository[EntityType, IDType]) -> None:
         """get_by_id() should raise NotFoundError if ID doesn't exist."""
-        with pytest.raises(EntityNotFoundError, match="not found"):
+        with pytest.raises(EntityNotFoundError):
             await repository.get_by_id(entity_id=str(ULID()))
 
     # ==================== Contract Tests: get_all ====================
 
     @pytest.mark.asyncio
-    async def test_get_all_returns_all_entities(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all() without parameters should return all entities."""
-        all_result = await repository_with_entities.get_all()
-        assert len(all_result) == 10
-
-    @pytest.mark.asyncio
-    async def test_get_all_with_limit_0(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(limit=0) should return an empty list."""
-        all_result = await repository_with_entities.get_all(limit=0)
-        assert len(all_result) == 0
-
-    @pytest.mark.asyncio
-    async def test_get_all_with_limit_5(
+    @pytest.mark.parametrize(
+        ("limit", "offset", "expected_count"),
+        [
+            pytest.param(None, 0, 10, id="all"),
+            pytest.param(0, 0, 0, id="limit_0"),
+            pytest.param(5, 0, 5, id="limit_5"),
+            pytest.param(15, 0, 10, id="limit_superior_to_len_entities"),
+            pytest.param(None, 6, 4, id="offset"),
+            pytest.param(None, 15, 0, id="offset_superior_to_len_entities"),
+            pytest.param(5, 2, 5, id="limit_with_offset_case_1"),
+            pytest.param(5, 8, 2, id="limit_with_offset_case_2"),
+            pytest.param(5, 10, 0, id="limit_with_offset_case_3"),
+        ],
+    )
+    async def test_get_all_pagination(
         self,
         repository_with_entities: Repository[EntityType, IDType],
-        entity_ids: list[IDType],
+        entity_model: type[EntityType],
+        limit: int | None,
+        offset: int,
+        expected_count: int,
     ) -> None:
-        """get_all(limit=5) should return exactly 5 entities."""
-        limit = 5
-        all_result = await repository_with_entities.get_all(limit=limit)
-        assert len(all_result) == 5
-        # Verify they are actual entities with valid IDs
-        for entity in all_result:
-            assert hasattr(entity, "id")
-            assert hasattr(entity, "name")
-
-    @pytest.mark.asyncio
-    async def test_get_all_with_limit_superior_to_len_entities(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(limit=15) when only 10 exist should return 10 entities."""
-        all_result = await repository_with_entities.get_all(limit=15)
-        assert len(all_result) == 10
+        """get_all(limit, offset) should return the requested window of the 10 entities."""
+        all_result = await repository_with_entities.get_all(limit=limit, offset=offset)
+        assert len(all_result) == expected_count
+        # Verify they are instances of the entity model
+        assert all(isinstance(entity, entity_model) for entity in all_result)
 
     @pytest.mark.asyncio
     async def test_get_all_with_limit_negative(
@@ -200,25 +195,6 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         with pytest.raises(PaginationParameterError, match="limit must be non-negative"):
             await repository_with_entities.get_all(limit=-1)
 
-    @pytest.mark.asyncio
-    async def test_get_all_with_offset(
-        self,
-        repository_with_entities: Repository[EntityType, IDType],
-        entity_ids: list[IDType],
-    ) -> None:
-        """get_all(offset=6) should skip first 6 entities."""
-        offset = 6
-        all_result = await repository_with_entities.get_all(offset=offset)
-        assert len(all_result) == 4
-
-    @pytest.mark.asyncio
-    async def test_get_all_with_offset_superior_to_len_entities(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(offset=15) when only 10 exist should return empty list."""
-        all_result = await repository_with_entities.get_all(offset=15)
-        assert len(all_result) == 0
-
     @pytest.mark.asyncio
     async def test_get_all_with_offset_negative(
         self, repository_with_entities: Repository[EntityType, IDType]
@@ -227,36 +203,6 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         with pytest.raises(PaginationParameterError, match="offset must be non-negative"):
             await repository_with_entities.get_all(offset=-1)
 
-    @pytest.mark.asyncio
-    async def test_get_all_limit_with_offset_case_1(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(limit=5, offset=2) should return 5 entities starting from index 2."""
-        offset = 2
-        limit = 5
-        all_result = await repository_with_entities.get_all(limit=limit, offset=offset)
-        assert len(all_result) == 5
-
-    @pytest.mark.asyncio
-    async def test_get_all_limit_with_offset_case_2(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(limit=5, offset=8) should return only 2 entities (8, 9)."""
-        offset = 8
-        limit = 5
-        all_result = await repository_with_entities.get_all(limit=limit, offset=offset)
-        assert len(all_result) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_all_limit_with_offset_case_3(
-        self, repository_with_entities: Repository[EntityType, IDType]
-    ) -> None:
-        """get_all(limit=5, offset=10) should return empty list."""
-        offset = 10
-        limit = 5
-        all_result = await repository_with_entities.get_all(limit=limit, offset=offset)
-        assert len(all_result) == 0
-
     # ==================== Contract Tests: insert_one ====================
 
     @pytest.mark.asyncio
@@ -314,7 +260,7 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         """insert_many() with one duplicate should raise DuplicateError."""
         entities = [entity_factory(entity_id=entity_ids[0], name="Duplicate")]
 
-        with pytest.raises(EntityAlreadyExistsError, match="already exists"):
+        with pytest.raises(EntityAlreadyExistsError):
             await repository_with_entities.insert_many(entities)
 
     @pytest.mark.asyncio
@@ -329,7 +275,7 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         entity2 = entity_factory(entity_id=entity1.id, name="Duplicate")
         entities = [entity1, entity2]
 
-        with pytest.raises(EntityAlreadyExistsError, match="already exists"):
+        with pytest.raises(EntityAlreadyExistsError):
             await repository.insert_many(entities)
 
     @pytest.mark.asyncio
@@ -391,7 +337,7 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
         """update() on non-existent entity should raise NotFoundError."""
         entity = entity_factory(name="Non-existent")
 
-        with pytest.raises(EntityNotFoundError, match="not found"):
+        with pytest.raises(EntityNotFoundError):
             await repository.update(entity)
 
     # ==================== Contract Tests: delete_by_id ====================
@@ -412,7 +358,7 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
     @pytest.mark.asyncio
     async def test_delete_failed(self, repository: Repository[EntityType, IDType]) -> None:
         """delete_by_id() on non-existent ID should raise NotFoundError."""
-        with pytest.raises(EntityNotFoundError, match="not found"):
+        with pytest.raises(EntityNotFoundError):
             await repository.delete_by_id(entity_id="nonexistent_id_67890")
 
     # ==================== Contract Tests: delete_all ====================
@@ -472,7 +418,7 @@ class RepositoryContractTests(ABC, Generic[EntityType, IDType]):
     ) -> None:
         """All repository exceptions should inherit from RepositoryError."""
         # NotFoundError is a RepositoryError
-        with pytest.raises(DatabaseError):
+        with pytest.raises(DatabaseError, match="not found"):
             await repository.get_by_id(entity_id="nonexistent")
 
         # DuplicateError is a RepositoryError
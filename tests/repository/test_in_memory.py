@@ -8,6 +8,7 @@ This module tests the InMemory implementation by:
 """
 
 from collections.abc import Callable
+import itertools
 
 from pydantic import BaseModel
 import pytest
@@ -15,16 +16,28 @@ import pytest_asyncio
 from ulid import ULID
 
 from infrakit.repository import InMemory
-from infrakit.repository.exceptions import EntityModelError
+from infrakit.repository.exceptions import EntityAlreadyExistsError, EntityModelError
 from infrakit.repository.memory.session import InMemorySession
 from tests.repository.test_contract import RepositoryContractTests
 
+WRONG_ENTITY_MODEL_MESSAGE = "Entity must be of type User, got Company"
+
 
 class User(BaseModel):
     id: str
     name: str
 
 
+class Company(BaseModel):
+    id: str
+    company_name: str
+
+
+class Product(BaseModel):
+    id: int
+    name: str
+
+
 class TestInMemoryRepository(RepositoryContractTests[User, str]):
     """Test suite for InMemory repository implementation."""
 
@@ -37,23 +50,43 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
 
     # ==================== Concrete Fixtures ====================
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def entity_factory(self) -> Callable[..., User]:
-        """Factory to create User entities for testing."""
+        """Factory to create User entities for testing.
+
+        The factory is built once per module. Generated IDs are ULIDs built from
+        a counter, which are unique within the module without drawing on the
+        clock or the system entropy source for every entity.
+        """
+        ids = itertools.count(1)
 
         def _create_user(entity_id: str | None = None, name: str = "Test User") -> User:
-            return User(id=entity_id or str(ULID()), name=name)
+            return User(id=entity_id or str(ULID.from_int(next(ids))), name=name)
 
         return _create_user
 
+    @pytest.fixture(scope="module")
+    def entity_model(self) -> type[User]:
+        """Return the entity model managed by the repository."""
+        return User
+
     @pytest.fixture
     def repository(self, session: InMemorySession) -> InMemory[User, str]:
         """Create an empty InMemory repository with auto_commit=True."""
         return InMemory(entity_model=User, auto_commit=True, session=session)
 
+    @pytest.fixture(scope="module")
+    def entities_template(self, entity_factory: Callable[..., User]) -> dict[str, User]:
+        """Build the 10 entities of repository_with_entities once per module.
+
+        Tests replace entities rather than mutate them, so they can be shared.
+        """
+        users = [entity_factory(name=f"User {i}") for i in range(10)]
+        return {user.id: user for user in users}
+
     @pytest_asyncio.fixture
     async def repository_with_entities(
-        self, repository: InMemory[User, str], entity_factory: Callable[..., User]
+        self, repository: InMemory[User, str], entities_template: dict[str, User]
     ) -> InMemory[User, str]:
         """
         Create a repository with 10 pre-inserted entities.
@@ -62,17 +95,24 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
         using repository.insert_one() in test setup.
         """
         # Direct access to committed storage (not via insert_one!)
-        storage = repository.session.get_committed_storage(User)
-        for i in range(10):
-            user = entity_factory(name=f"User {i}")
-            storage[user.id] = user
+        repository.session.get_committed_storage(User).update(entities_template)
         return repository
 
+    @pytest.fixture(scope="module")
+    def template_ids(self, entities_template: dict[str, User]) -> list[str]:
+        """List the IDs of entities_template once per module."""
+        return list(entities_template)
+
     @pytest.fixture
-    def entity_ids(self, repository_with_entities: InMemory[User, str]) -> list[str]:
-        """Get list of entity IDs from the repository."""
-        # Direct access to internal storage (not via get_all!)
-        return list(repository_with_entities.entities.keys())
+    def entity_ids(
+        self, repository_with_entities: InMemory[User, str], template_ids: list[str]
+    ) -> list[str]:
+        """Get list of entity IDs from the repository.
+
+        repository_with_entities holds exactly the template entities, so their
+        IDs are read from the template (not via get_all!).
+        """
+        return template_ids
 
     # ==================== Auto-Commit Fixtures ====================
 
@@ -97,7 +137,7 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
     async def _verify_entity_exists(self, repo: InMemory[User, str], entity_id: str) -> bool:
         """Verify entity exists by directly checking internal storage."""
         # Access via property to get the _entities dict
-        return str(entity_id) in repo.entities
+        return entity_id in repo.entities
 
     async def _verify_entity_count(self, repo: InMemory[User, str]) -> int:
         """Count entities by directly checking internal storage."""
@@ -107,34 +147,22 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
         self, repo: InMemory[User, str], entity_id: str, expected_name: str
     ) -> bool:
         """Verify entity data by directly checking internal storage."""
-        if str(entity_id) not in repo.entities:
-            return False
-        entity = repo.entities[str(entity_id)]
-        return entity.name == expected_name
+        entity = repo.entities.get(entity_id)
+        return entity is not None and entity.name == expected_name
 
     # ==================== InMemory-Specific Tests ====================
 
     @pytest.mark.asyncio
-    async def test_entity_model_raise_error(self, repository: InMemory[User, str]) -> None:
+    @pytest.mark.parametrize("operation", ["insert_one", "insert_many", "update"])
+    async def test_entity_model_raise_error(
+        self, repository: InMemory[User, str], operation: str
+    ) -> None:
         """InMemory should validate that entities match the expected model type."""
-
-        class Company(BaseModel):
-            id: str
-            company_name: str
-
         new_company = Company(id=str(ULID()), company_name="Acme Corp")
+        argument = [new_company] if operation == "insert_many" else new_company
 
-        # insert_one should reject wrong entity type
-        with pytest.raises(EntityModelError, match="Entity must be of type User, got Company"):
-            await repository.insert_one(new_company)  # type: ignore[arg-type]
-
-        # insert_many should reject wrong entity type
-        with pytest.raises(EntityModelError, match="Entity must be of type User, got Company"):
-            await repository.insert_many([new_company])  # type: ignore[arg-type]
-
-        # update should reject wrong entity type
-        with pytest.raises(EntityModelError, match="Entity must be of type User, got Company"):
-            await repository.update(new_company)  # type: ignore[arg-type]
+        with pytest.raises(EntityModelError, match=WRONG_ENTITY_MODEL_MESSAGE):
+            await getattr(repository, operation)(argument)
 
     @pytest.mark.asyncio
     async def test_get_all_preserves_insertion_order(self) -> None:
@@ -144,11 +172,6 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
         This is a documented behavior specific to InMemory implementation.
         InMemory uses Python's dict which preserves insertion order (Python 3.7+).
         """
-
-        class Product(BaseModel):
-            id: int
-            name: str
-
         repo: InMemory[Product, int] = InMemory(entity_model=Product, auto_commit=True)
 
         # Insert with IDs in non-ascending order
@@ -161,3 +184,91 @@ class TestInMemoryRepository(RepositoryContractTests[User, str]):
         # Should preserve insertion order, NOT sort by ID
         assert [p.id for p in result] == [300, 100, 200]
         assert [p.name for p in result] == ["Third", "First", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_insert_one_same_instance_twice(
+        self, repository: InMemory[User, str], entity_factory: Callable[..., User]
+    ) -> None:
+        """Inserting the very same instance twice should raise EntityAlreadyExistsError."""
+        user = entity_factory(name="Alice")
+        await repository.insert_one(user)
+
+        with pytest.raises(EntityAlreadyExistsError):
+            await repository.insert_one(user)
+
+    @pytest.mark.asyncio
+    async def test_delete_all_clears_storage_in_place(
+        self, repository_with_entities: InMemory[User, str]
+    ) -> None:
+        """delete_all() should empty the existing storage dict rather than replace it."""
+        storage = repository_with_entities.entities
+
+        await repository_with_entities.delete_all()
+
+        assert repository_with_entities.entities is storage
+        assert storage == {}
+
+    @pytest.mark.asyncio
+    async def test_reassigning_session_switches_storage(
+        self, entity_factory: Callable[..., User]
+    ) -> None:
+        """A new session at the same generation must not reuse the old session's dicts."""
+        first, second = InMemorySession(), InMemorySession()
+        repo: InMemory[User, str] = InMemory(entity_model=User, auto_commit=True, session=first)
+        await repo.get_all()
+
+        repo.session = second
+        user = entity_factory(name="Alice")
+        await repo.insert_one(user)
+
+        assert await repo.get_all() == [user]
+        assert user.id in second.get_committed_storage(User)
+        assert first.get_committed_storage(User) == {}
+
+    @pytest.mark.asyncio
+    async def test_changing_auto_commit_rebinds_commit_behavior(
+        self,
+        repository_auto_commit_false: InMemory[User, str],
+        entity_factory: Callable[..., User],
+    ) -> None:
+        """Setting auto_commit after construction should switch the commit behavior."""
+        repo = repository_auto_commit_false
+        repo.auto_commit = True
+
+        user = entity_factory(name="Alice")
+        await repo.insert_one(user)
+
+        assert not repo.session.in_transaction
+        assert user.id in repo.entities
+
+    @pytest.mark.asyncio
+    async def test_reads_in_transaction_see_staged_writes(
+        self, session: InMemorySession, entity_factory: Callable[..., User]
+    ) -> None:
+        """Reads before and after a write in the same transaction see the staged state."""
+        repo: InMemory[User, str] = InMemory(entity_model=User, auto_commit=False, session=session)
+        await session.begin()
+
+        assert await repo.get_all() == []
+        user = entity_factory(name="Alice")
+        await repo.insert_one(user)
+
+        assert await repo.get_by_id(user.id) == user
+        assert repo.entities == {}
+        await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_in_place_mutation_is_not_rolled_back(
+        self, session: InMemorySession, entity_factory: Callable[..., User]
+    ) -> None:
+        """Entities are shared with the session, so in-place mutations bypass transactions."""
+        user = entity_factory(name="Alice")
+        session.get_committed_storage(User)[user.id] = user
+        repo: InMemory[User, str] = InMemory(entity_model=User, auto_commit=False, session=session)
+        await session.begin()
+
+        entity = await repo.get_by_id(user.id)
+        entity.name = "Mutated"
+        await session.rollback()
+
+        assert repo.entities[user.id].name == "Mutated"
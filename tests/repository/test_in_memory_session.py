@@ -16,7 +16,7 @@ from infrakit.repository.exceptions import DatabaseError
 from infrakit.repository.memory.session import InMemorySession
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Test entity with id attribute."""
 
@@ -24,7 +24,7 @@ class User:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Test entity for multi-type storage tests."""
 
@@ -117,8 +117,8 @@ class TestInMemorySessionSessionBasedPattern:
         assert session.in_transaction
 
     @pytest.mark.asyncio
-    async def test_begin_creates_snapshot_of_storage(self) -> None:
-        """Test that begin() creates a deep copy snapshot of storage into staging."""
+    async def test_begin_does_not_copy_storage(self) -> None:
+        """Test that begin() stages nothing until an entity type is accessed."""
         session = InMemorySession()
 
         # Setup: add initial data directly to _storage
@@ -127,8 +127,14 @@ class TestInMemorySessionSessionBasedPattern:
         # Test: begin transaction
         await session.begin()
 
-        # Verify: staging should have the data (snapshot) - check via direct access
-        assert session._staging == session._storage  # noqa: SLF001
+        # Verify: nothing is copied yet
+        assert session._staging == {}  # noqa: SLF001
+
+        # Verify: first access copies the committed entities of that type only
+        staging = session.get_active_storage(User)
+        assert staging == session._storage[User]  # noqa: SLF001
+        assert staging is not session._storage[User]  # noqa: SLF001
+        assert list(session._staging) == [User]  # noqa: SLF001
 
     @pytest.mark.asyncio
     async def test_changes_in_transaction_go_to_staging(self) -> None:
@@ -196,6 +202,34 @@ class TestInMemorySessionSessionBasedPattern:
         # Verify: storage should have the data
         assert "1" in session._storage[User]  # noqa: SLF001
 
+    @pytest.mark.asyncio
+    async def test_generation_changes_on_transaction_boundaries(self) -> None:
+        """Test that begin(), commit() and rollback() each change the generation."""
+        session = InMemorySession()
+        generations = [session.generation]
+
+        for step in (session.begin, session.commit, session.begin, session.rollback):
+            await step()
+            generations.append(session.generation)
+
+        assert len(set(generations)) == len(generations)
+
+    @pytest.mark.asyncio
+    async def test_commit_publishes_staged_dict_without_copying(self) -> None:
+        """Test that commit() moves the staged dict into storage instead of copying it."""
+        session = InMemorySession()
+
+        await session.begin()
+        staged = session.get_active_storage(User)
+        staged["1"] = User(id="1", name="Alice")
+
+        # Test: commit
+        await session.commit()
+
+        # Verify: the staged dict is now the committed one, and staging is empty
+        assert session._storage[User] is staged  # noqa: SLF001
+        assert session._staging == {}  # noqa: SLF001
+
     @pytest.mark.asyncio
     async def test_rollback_discards_staged_changes(self) -> None:
         """Test that rollback() discards all staged changes.
@@ -260,53 +294,56 @@ class TestInMemorySessionSessionBasedPattern:
 
 
 class TestInMemorySessionIsolation:
-    """Tests for deep copy isolation between staging and storage."""
+    """Tests for copy-on-write isolation between staging and storage."""
 
     @pytest.mark.asyncio
     async def test_modifying_staging_does_not_affect_storage(self) -> None:
-        """Test that modifying staging entities does not affect storage (deep copy)."""
+        """Test that replacing or removing staged entities does not affect storage."""
         session = InMemorySession()
 
         # Setup: add initial data directly to _storage
-        session._storage[User] = {"1": User(id="1", name="Alice")}  # noqa: SLF001
+        session._storage[User] = {  # noqa: SLF001
+            "1": User(id="1", name="Alice"),
+            "2": User(id="2", name="Bob"),
+        }
 
-        # Begin transaction (creates snapshot)
         await session.begin()
 
-        # Test: modify the entity in staging via get_active_storage
-        session.get_active_storage(User)["1"].name = "Modified Alice"
+        # Test: replace and delete entities in staging via get_active_storage
+        staging = session.get_active_storage(User)
+        staging["1"] = User(id="1", name="Modified Alice")
+        del staging["2"]
 
         # Verify: storage should be unchanged (direct access)
         assert session._storage[User]["1"].name == "Alice"  # noqa: SLF001
+        assert "2" in session._storage[User]  # noqa: SLF001
 
     @pytest.mark.asyncio
-    async def test_commit_creates_independent_copy(self) -> None:
-        """Test that commit() creates an independent copy from staging to storage."""
+    async def test_commit_keeps_entity_types_not_staged(self) -> None:
+        """Test that commit() only replaces the entity types accessed in the transaction."""
         session = InMemorySession()
 
-        await session.begin()
+        # Setup: add initial data directly to _storage
+        order_storage = {"100": Order(id="100", total=500)}
+        session._storage[Order] = order_storage  # noqa: SLF001
 
-        # Add data to staging via get_active_storage
+        await session.begin()
         user = User(id="1", name="Alice")
         session.get_active_storage(User)["1"] = user
 
         # Test: commit
         await session.commit()
 
-        # Verify: get the user from _storage (direct access)
-        stored_user = session._storage[User]["1"]  # noqa: SLF001
-
-        # They should have the same data but be different objects
-        assert stored_user.name == "Alice"
-        assert stored_user is not user  # Different objects due to deep copy
+        # Verify: staged entities are stored as is, untouched types are not copied
+        assert session._storage[User]["1"] is user  # noqa: SLF001
+        assert session._storage[Order] is order_storage  # noqa: SLF001
 
     @pytest.mark.asyncio
-    async def test_modifying_original_object_after_begin_does_not_affect_staging(self) -> None:
-        """Test that modifying the original object in storage doesn't affect staging snapshot.
+    async def test_entities_are_shared_between_storage_and_staging(self) -> None:
+        """Test that staging copies the storage dict but not the entities.
 
-        This verifies that begin() creates a true deep copy, not just a shallow copy
-        or a reference. If the deep copy isn't working, modifying the original object
-        would also modify the snapshot in staging.
+        Entities must be treated as immutable: mutating one in place is visible
+        from both storage and staging, and cannot be rolled back.
         """
         session = InMemorySession()
 
@@ -314,46 +351,54 @@ class TestInMemorySessionIsolation:
         user = User(id="1", name="Alice")
         session._storage[User] = {"1": user}  # noqa: SLF001
 
-        # Begin transaction (should create deep copy snapshot)
         await session.begin()
 
-        # Test: Modify the ORIGINAL object in storage (not via session API)
-        user.name = "Modified Alice"
-
-        # Verify: The staging snapshot should still have the original value
-        assert session._staging[User]["1"].name == "Alice"  # noqa: SLF001
-
-        # Verify: Storage has the modified value
-        assert session._storage[User]["1"].name == "Modified Alice"  # noqa: SLF001
+        # Verify: The staged entity is the stored instance
+        assert session.get_active_storage(User)["1"] is user
 
     @pytest.mark.asyncio
-    async def test_modifying_staging_after_commit_does_not_affect_storage(self) -> None:
-        """Test that modifying staging dict after commit doesn't affect committed storage.
+    async def test_new_transaction_does_not_write_through_committed_storage(self) -> None:
+        """Test that a transaction following a commit stages a fresh copy.
 
-        This verifies that commit() creates a deep copy when applying changes,
-        not just a reference assignment. Without deep copy, holding a reference
-        to the old staging dict could allow post-commit modifications.
+        The committed dict is the former staging dict, so the next transaction
+        must copy it again rather than write into it.
         """
         session = InMemorySession()
 
         await session.begin()
+        session.get_active_storage(User)["1"] = User(id="1", name="Alice")
+        await session.commit()
 
-        # Add user to staging
-        user = User(id="1", name="Alice")
-        staging_dict = session.get_active_storage(User)
-        staging_dict["1"] = user
+        # Test: start another transaction and write to it
+        await session.begin()
+        session.get_active_storage(User)["2"] = User(id="2", name="Bob")
+
+        # Verify: committed storage is not affected until commit
+        assert "2" not in session._storage[User]  # noqa: SLF001
 
-        # Keep a reference to staging before commit
-        old_staging_ref = session._staging[User]  # noqa: SLF001
+        await session.rollback()
+        assert list(session._storage[User]) == ["1"]  # noqa: SLF001
 
-        # Commit (should deep copy staging to storage)
-        await session.commit()
+    @pytest.mark.asyncio
+    async def test_reading_does_not_stage_a_copy(self) -> None:
+        """Test that get_readable_storage() reads committed storage until a type is written."""
+        session = InMemorySession()
 
-        # Test: Modify via the old staging reference
-        old_staging_ref["1"].name = "Hacked"
+        # Setup: add initial data directly to _storage
+        session._storage[User] = {"1": User(id="1", name="Alice")}  # noqa: SLF001
 
-        # Verify: Storage should NOT be affected (deep copy protection)
-        assert session._storage[User]["1"].name == "Alice"  # noqa: SLF001
+        await session.begin()
+
+        # Test: read before any write
+        readable = session.get_readable_storage(User)
+
+        # Verify: nothing was staged, committed storage is read directly
+        assert readable is session._storage[User]  # noqa: SLF001
+        assert session._staging == {}  # noqa: SLF001
+
+        # Verify: once written, reads see the staged copy
+        session.get_active_storage(User)["2"] = User(id="2", name="Bob")
+        assert "2" in session.get_readable_storage(User)
 
 
 class TestInMemorySessionContextManager:
@@ -541,8 +586,8 @@ class TestInMemorySessionEdgeCases:
         during a transaction, those changes will be LOST on commit because
         commit() replaces storage with staging.
 
-        The staging is a snapshot taken at begin() time, so:
-        1. Initial storage is copied to staging at begin()
+        The staging is a copy taken on first access during the transaction, so:
+        1. Initial storage is copied to staging by get_active_storage()
         2. Changes via session API go to staging
         3. Direct storage modifications are ignored
         4. On commit, storage is replaced by staging (direct mods lost)
@@ -552,10 +597,10 @@ class TestInMemorySessionEdgeCases:
         # Setup: Add initial data
         session._storage[User] = {"1": User(id="1", name="Alice")}  # noqa: SLF001
 
-        # Begin transaction (staging = copy of storage with "1")
+        # Begin transaction
         await session.begin()
 
-        # Add user via session (correct way - goes to staging)
+        # Add user via session (correct way - staging = copy of storage with "1")
         session.get_active_storage(User)["2"] = User(id="2", name="Bob")
 
         # BAD PRACTICE: Someone modifies storage directly during transaction
@@ -595,7 +640,7 @@ class TestInMemorySessionEdgeCases:
         will persist even after rollback.
 
         This is by design to avoid the performance cost of maintaining a second
-        deep copy snapshot. Repositories should NEVER directly modify _storage
+        copy of the storage. Repositories should NEVER directly modify _storage
         during a transaction - always use get_active_storage().
         """
         session = InMemorySession()
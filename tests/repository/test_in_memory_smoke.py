@@ -83,8 +83,10 @@ class TestInMemoryWithIntId:
         await product_repo.insert_one(product)
 
         duplicate = Product(id=1, name="Different Product", price=500.00)
-        with pytest.raises(EntityAlreadyExistsError, match="Product with id '1' already exists"):
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
             await product_repo.insert_one(duplicate)
+        assert exc_info.value.entity_type == "Product"
+        assert exc_info.value.entity_id == "1"
 
     @pytest.mark.asyncio
     async def test_get_all_with_pagination(self, product_repo: InMemory[Product, int]) -> None:
@@ -123,15 +125,15 @@ class TestInMemoryWithIntId:
         """Smoke test: NotFoundError with int IDs."""
         non_existent_id = uuid4()
 
-        with pytest.raises(
-            EntityNotFoundError, match=f"Product with id '{non_existent_id}' not found"
-        ):
+        with pytest.raises(EntityNotFoundError) as exc_info:
             await product_repo.get_by_id(non_existent_id)
+        assert exc_info.value.entity_type == "Product"
+        assert exc_info.value.entity_id == str(non_existent_id)
 
-        with pytest.raises(
-            EntityNotFoundError, match=f"Product with id '{non_existent_id}' not found"
-        ):
+        with pytest.raises(EntityNotFoundError) as exc_info:
             await product_repo.delete_by_id(non_existent_id)
+        assert exc_info.value.entity_type == "Product"
+        assert exc_info.value.entity_id == str(non_existent_id)
 
     @pytest.mark.asyncio
     async def test_insertion_order_preserved(self, product_repo: InMemory[Product, int]) -> None:
@@ -205,10 +207,10 @@ class TestInMemoryWithUUID:
         await order_repo.insert_one(order)
 
         duplicate = Order(id=order_id, order_number="ORD-002", total=200.00)
-        with pytest.raises(
-            EntityAlreadyExistsError, match=f"Order with id '{order_id}' already exists"
-        ):
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
             await order_repo.insert_one(duplicate)
+        assert exc_info.value.entity_type == "Order"
+        assert exc_info.value.entity_id == str(order_id)
 
     @pytest.mark.asyncio
     async def test_get_all_with_pagination(self, order_repo: InMemory[Order, UUID]) -> None:
@@ -248,15 +250,15 @@ class TestInMemoryWithUUID:
         """Smoke test: NotFoundError with UUID IDs."""
         non_existent_id = uuid4()
 
-        with pytest.raises(
-            EntityNotFoundError, match=f"Order with id '{non_existent_id}' not found"
-        ):
+        with pytest.raises(EntityNotFoundError) as exc_info:
             await order_repo.get_by_id(non_existent_id)
+        assert exc_info.value.entity_type == "Order"
+        assert exc_info.value.entity_id == str(non_existent_id)
 
-        with pytest.raises(
-            EntityNotFoundError, match=f"Order with id '{non_existent_id}' not found"
-        ):
+        with pytest.raises(EntityNotFoundError) as exc_info:
             await order_repo.delete_by_id(non_existent_id)
+        assert exc_info.value.entity_type == "Order"
+        assert exc_info.value.entity_id == str(non_existent_id)
 
     @pytest.mark.asyncio
     async def test_insertion_order_preserved(self, order_repo: InMemory[Order, UUID]) -> None:
@@ -226,6 +226,7 @@ class TestCreateDefaultSessionFactoryUnit:
         assert mock_create_engine.call_args[1]["echo"] is True
 
 
+@pytest.mark.slow
 class TestCreateDefaultSessionFactoryIntegration:
     """Integration tests with real PostgreSQL container."""
 
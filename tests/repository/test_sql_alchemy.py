@@ -5,6 +5,8 @@ This module tests the SqlAlchemy implementation by:
 1. Inheriting all contract tests from RepositoryContractTests
 2. Implementing verification methods using plain SQL (as per TESTING_RULES.md)
 3. Adding SqlAlchemy-specific tests (auto_commit behavior, transactions, etc.)
+4. Running the not-found paths of update() and delete_by_id() on SQLite,
+   which needs no container
 
 See TESTING_RULES.md for important testing principles.
 """
@@ -27,7 +29,7 @@ from testcontainers.postgres import PostgresContainer
 from ulid import ULID
 
 from infrakit.repository import SqlAlchemy
-from infrakit.repository.exceptions import DatabaseError
+from infrakit.repository.exceptions import DatabaseError, EntityNotFoundError
 from tests.repository.test_contract import RepositoryContractTests
 
 
@@ -42,6 +44,7 @@ class UserModel(Base):
     name = Column(String, nullable=False)
 
 
+@pytest.mark.slow
 class TestSqlAlchemyRepository(RepositoryContractTests[UserModel, str]):
     """Test suite for SqlAlchemy repository implementation."""
 
@@ -113,6 +116,11 @@ class TestSqlAlchemyRepository(RepositoryContractTests[UserModel, str]):
 
         return _create_user
 
+    @pytest.fixture
+    def entity_model(self) -> type[UserModel]:
+        """Return the SQLAlchemy model managed by the repository."""
+        return UserModel
+
     # PyCharm warning: pytest fixtures use dependency injection - signatures may differ
     # between implementations (InMemory has no deps, SqlAlchemy needs session)
     # noinspection PyMethodOverriding
@@ -134,13 +142,11 @@ class TestSqlAlchemyRepository(RepositoryContractTests[UserModel, str]):
         CRITICAL: Uses plain SQL for insertion (not repository.insert_one!)
         as per TESTING_RULES.md - we never test code with itself.
         """
-        # Insertion with plain SQL (not via repository methods!)
-        for i in range(10):
-            user_id = str(ULID())
-            await session.execute(
-                text("INSERT INTO users (id, name) VALUES (:id, :name)"),
-                {"id": user_id, "name": f"User {i}"},
-            )
+        # Insertion with plain SQL (not via repository methods!), in one executemany
+        await session.execute(
+            text("INSERT INTO users (id, name) VALUES (:id, :name)"),
+            [{"id": str(ULID()), "name": f"User {i}"} for i in range(10)],
+        )
         await session.commit()
         return repository
 
@@ -361,3 +367,76 @@ class TestSqlAlchemyRepository(RepositoryContractTests[UserModel, str]):
         assert "connection lost during select" in str(exc_info.value) or "Database error" in str(
             exc_info.value
         )
+
+
+class TestSqlAlchemyRepositoryOnSqlite:
+    """SqlAlchemy-specific tests that only need SQLite (aiosqlite), not a container."""
+
+    @pytest_asyncio.fixture(name="session")
+    async def create_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Create a session on a fresh in-memory SQLite database for each test."""
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+
+        await engine.dispose()
+
+    async def _count_users(self, session: AsyncSession, entity_id: str) -> int:
+        """Count the rows with the given id using plain SQL (see TESTING_RULES.md)."""
+        result = await session.execute(
+            text("SELECT COUNT(*) FROM users WHERE id = :id"), {"id": entity_id}
+        )
+        return result.scalar_one()
+
+    @pytest.mark.asyncio
+    async def test_update_not_found_keeps_pending_inserts(self, session: AsyncSession) -> None:
+        """update() of a missing entity only discards its own merged instance."""
+        repo: SqlAlchemy[UserModel, str] = SqlAlchemy(
+            session=session, entity_model=UserModel, auto_commit=False
+        )
+        pending_id, missing_id = str(ULID()), str(ULID())
+        await repo.insert_one(UserModel(id=pending_id, name="Pending"))
+
+        with pytest.raises(EntityNotFoundError) as exc_info:
+            await repo.update(UserModel(id=missing_id, name="Missing"))
+        await session.commit()
+
+        assert exc_info.value.entity_id == missing_id
+        assert await self._count_users(session, pending_id) == 1
+        assert await self._count_users(session, missing_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_by_id_not_found(self, session: AsyncSession) -> None:
+        """delete_by_id() raises EntityNotFoundError when the DELETE matches no row."""
+        repo: SqlAlchemy[UserModel, str] = SqlAlchemy(
+            session=session, entity_model=UserModel, auto_commit=True
+        )
+        existing_id, missing_id = str(ULID()), str(ULID())
+        await repo.insert_one(UserModel(id=existing_id, name="Existing"))
+
+        with pytest.raises(EntityNotFoundError) as exc_info:
+            await repo.delete_by_id(missing_id)
+
+        assert exc_info.value.entity_id == missing_id
+        assert await self._count_users(session, existing_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_by_id_is_rolled_back_with_the_transaction(
+        self, session: AsyncSession
+    ) -> None:
+        """With auto_commit=False the DELETE runs at once but is undone by a rollback."""
+        repo: SqlAlchemy[UserModel, str] = SqlAlchemy(
+            session=session, entity_model=UserModel, auto_commit=False
+        )
+        existing_id = str(ULID())
+        await repo.insert_one(UserModel(id=existing_id, name="Existing"))
+        await session.commit()
+
+        await repo.delete_by_id(existing_id)
+        assert await self._count_users(session, existing_id) == 0
+        await session.rollback()
+
+        assert await self._count_users(session, existing_id) == 1
@@ -38,6 +38,7 @@ class Company(Base):
     name = Column(String, nullable=False)
 
 
+@pytest.mark.slow
 class TestSqlAlchemyUnitOfWork:
     @pytest.fixture(scope="module", name="postgres_container")
     def init_postgres_container(self) -> Generator[PostgresContainer, None, None]: